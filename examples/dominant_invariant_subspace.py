@@ -24,15 +24,19 @@ def create_cost_and_derivates(manifold, matrix, backend):
 
         @pymanopt.function.numpy(manifold)
         def cost(X):
-            return -np.trace(X.T @ matrix @ X)
+            # Equivalent to -trace(X^T A X) without forming the p x n product
+            # X^T A.
+            return -np.vdot(X, matrix @ X)
 
+        # Since the matrix is symmetric, the gradient -(A + A^T) X of the cost
+        # simplifies to -2 A X.
         @pymanopt.function.numpy(manifold)
         def euclidean_gradient(X):
-            return -(matrix + matrix.T) @ X
+            return -2 * (matrix @ X)
 
         @pymanopt.function.numpy(manifold)
         def euclidean_hessian(X, H):
-            return -(matrix + matrix.T) @ H
+            return -2 * (matrix @ H)
 
     elif backend == "pytorch":
         matrix_ = torch.from_numpy(matrix)
@@ -1,10 +1,89 @@
+import functools
+
 import numpy as np
-from numpy.linalg import svd
+from scipy.linalg.lapack import get_lapack_funcs
 
 from pymanopt.manifolds.manifold import Manifold
+from pymanopt.tools._svd_cache import CACHE_SIZE, cached_svd
 from pymanopt.tools.multi import multihconj, multiprod, multitransp
 
 
+def _thin_svd(matrix, *, compute_uv=True, overwrite=False):
+    """Thin singular value decomposition of a matrix or a stack of matrices.
+
+    Single matrices are decomposed with LAPACK's ``gesdd`` driver, reusing
+    workspace queries across calls with matrices of the same shape, and
+    without checking the input for non-finite values first.
+    If ``overwrite`` is true, the memory of ``matrix`` may be reused.
+    """
+    if matrix.ndim == 2:
+        return cached_svd(matrix, compute_uv=compute_uv, overwrite_a=overwrite)
+    return np.linalg.svd(matrix, full_matrices=False, compute_uv=compute_uv)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _get_qr_funcs(dtype):
+    return get_lapack_funcs(("geqrf", "orgqr"), dtype=dtype)
+
+
+def _qr_orthonormal_factor(matrix):
+    """Orthonormal factor of the thin QR decomposition of (stacked) matrices.
+
+    The signs (or phases in the complex case) of the columns are chosen such
+    that the triangular factor has a positive real diagonal.
+    Single matrices are decomposed by calling LAPACK directly since the
+    overhead of :func:`numpy.linalg.qr` dominates for small matrices.
+    """
+    if matrix.ndim == 2:
+        geqrf, orgqr = _get_qr_funcs(matrix.dtype)
+        qr, tau, _, info = geqrf(matrix)
+        if info != 0:
+            raise np.linalg.LinAlgError(
+                f"Illegal value in argument {-info} of internal geqrf"
+            )
+        diagonal = np.diag(qr)
+        q, _, info = orgqr(qr, tau)
+        if info != 0:
+            raise np.linalg.LinAlgError(
+                f"Illegal value in argument {-info} of internal orgqr"
+            )
+    else:
+        q, r = np.linalg.qr(matrix)
+        diagonal = np.diagonal(r, axis1=-2, axis2=-1)
+    if np.iscomplexobj(diagonal):
+        magnitude = np.abs(diagonal)
+        phase = np.divide(
+            diagonal,
+            magnitude,
+            out=np.ones_like(diagonal),
+            where=magnitude != 0,
+        )
+    else:
+        phase = np.where(diagonal < 0, -1.0, 1.0)
+    q *= np.expand_dims(phase, -2)
+    return q
+
+
+def _column_norms(matrix):
+    """Euclidean norms of the columns of (stacked) matrices.
+
+    This avoids the temporaries of ``np.linalg.norm(matrix, axis=-2)``.
+    """
+    squared = np.einsum("...ij,...ij->...j", matrix.real, matrix.real)
+    if np.iscomplexobj(matrix):
+        squared += np.einsum("...ij,...ij->...j", matrix.imag, matrix.imag)
+    return np.sqrt(squared)
+
+
+def _complex_normal(shape):
+    """Draw complex normal samples with a single call to the RNG.
+
+    The real and imaginary parts are drawn as the two components of a trailing
+    axis which is then reinterpreted as a complex number.
+    """
+    return np.random.normal(size=(*shape, 2)).view(np.complex128)[..., 0]
+
+
 class _GrassmannBase(Manifold):
     @property
     def typical_dist(self):
@@ -24,6 +103,42 @@ class _GrassmannBase(Manifold):
     def euclidean_to_riemannian_gradient(self, point, euclidean_gradient):
         return self.projection(point, euclidean_gradient)
 
+    def dist(self, point_a, point_b):
+        # With the SVD X^H Y = U diag(c) V^H, the c are the cosines of the
+        # principal angles between the subspaces. Their arccosines are
+        # accurate for angles of at least pi/4, which is the common case for
+        # distant subspaces. Smaller angles are determined accurately by
+        # their sines, the column norms of (Y - X X^H Y) V, so combine both
+        # with arctan2 in that case.
+        XHY = multiprod(multihconj(point_a), point_b)
+        _, cosines, vh = _thin_svd(XHY)
+        if np.all(cosines <= np.sqrt(0.5)):
+            return np.linalg.norm(np.arccos(cosines))
+        residual = multiprod(point_a, XHY)
+        np.subtract(point_b, residual, out=residual)
+        sines = _column_norms(multiprod(residual, multihconj(vh)))
+        return np.linalg.norm(np.arctan2(sines, cosines))
+
+    def _set_retraction(self, retraction):
+        try:
+            self._retraction = getattr(self, f"_retraction_{retraction}")
+        except AttributeError:
+            raise ValueError(f"Invalid retraction type '{retraction}'")
+
+    def retraction(self, point, tangent_vector):
+        return self._retraction(point, tangent_vector)
+
+    def _retraction_qr(self, point, tangent_vector):
+        # Only the column space of the result matters. We nevertheless fix
+        # the signs of the columns such that the result is close to X+G for
+        # small tangent vectors G.
+        return _qr_orthonormal_factor(point + tangent_vector)
+
+    def _retraction_polar(self, point, tangent_vector):
+        # Compute the polar factorization of Y = X+G
+        u, _, vt = _thin_svd(point + tangent_vector, overwrite=True)
+        return multiprod(u, vt)
+
 
 class Grassmann(_GrassmannBase):
     r"""The Grassmann manifold.
@@ -39,6 +154,8 @@ class Grassmann(_GrassmannBase):
         n: Dimension of the ambient space.
         p: Dimension of the subspaces.
         k: The number of elements in the product.
+        retraction: The type of retraction to use.
+            Possible choices are ``polar`` and ``qr``.
 
     Note:
         The geometry assumed here is the one obtained by treating the
@@ -46,9 +163,16 @@ class Grassmann(_GrassmannBase):
         (see also :class:`pymanopt.manifolds.stiefel.Stiefel`)
         with the orthogonal group :math:`\O(p) = \set{\vmQ \in \R^{p \times p}
         : \transp{\vmQ}\vmQ = \vmQ\transp{\vmQ} = \Id_p}`.
+
+        The default retraction is the polar retraction.
+        The retraction based on the QR decomposition, which is selected with
+        ``Grassmann(n, p, k=k, retraction="qr")``, is cheaper to compute for
+        large ``p`` or products of Grassmannians.
     """
 
-    def __init__(self, n: int, p: int, *, k: int = 1):
+    def __init__(
+        self, n: int, p: int, *, k: int = 1, retraction: str = "polar"
+    ):
         self._n = n
         self._p = p
         self._k = k
@@ -67,11 +191,7 @@ class Grassmann(_GrassmannBase):
         dimension = int(k * (n * p - p**2))
         super().__init__(name, dimension)
 
-    def dist(self, point_a, point_b):
-        s = svd(multiprod(multitransp(point_a), point_b), compute_uv=False)
-        s[s > 1] = 1
-        s = np.arccos(s)
-        return np.linalg.norm(s)
+        self._set_retraction(retraction)
 
     def inner_product(self, point, tangent_vector_a, tangent_vector_b):
         return np.tensordot(
@@ -79,35 +199,32 @@ class Grassmann(_GrassmannBase):
         )
 
     def projection(self, point, vector):
-        return vector - multiprod(point, multiprod(multitransp(point), vector))
+        # Write the result into the buffer of the product to save allocating
+        # another array of the size of the vector.
+        projected = multiprod(point, multiprod(multitransp(point), vector))
+        return np.subtract(vector, projected, out=projected)
 
     def euclidean_to_riemannian_hessian(
         self, point, euclidean_gradient, euclidean_hessian, tangent_vector
     ):
-        PXehess = self.projection(point, euclidean_hessian)
-        XtG = multiprod(multitransp(point), euclidean_gradient)
-        HXtG = multiprod(tangent_vector, XtG)
-        return PXehess - HXtG
-
-    def retraction(self, point, tangent_vector):
-        # We do not need to worry about flipping signs of columns here,
-        # since only the column space is important, not the actual
-        # columns. Compare this with the Stiefel manifold.
-
-        # Compute the polar factorization of Y = X+G
-        u, _, vt = svd(point + tangent_vector, full_matrices=False)
-        return multiprod(u, vt)
+        # Products are associated such that only p x p matrices are formed
+        # as intermediates, i.e., we never compute the n x n matrix X X^T.
+        # Stacking the Hessian and gradient to share a single product with
+        # X^T does not pay off since the copy costs more than the saved call.
+        Xt = multitransp(point)
+        PXehess = multiprod(point, multiprod(Xt, euclidean_hessian))
+        np.subtract(euclidean_hessian, PXehess, out=PXehess)
+        XtG = multiprod(Xt, euclidean_gradient)
+        PXehess -= multiprod(tangent_vector, XtG)
+        return PXehess
 
     def random_point(self):
         if self._k == 1:
-            X = np.random.normal(size=(self._n, self._p))
-            q, _ = np.linalg.qr(X)
-            return q
-
-        X = np.zeros((self._k, self._n, self._p))
-        for i in range(self._k):
-            X[i], _ = np.linalg.qr(np.random.normal(size=(self._n, self._p)))
-        return X
+            shape = (self._n, self._p)
+        else:
+            shape = (self._k, self._n, self._p)
+        q, _ = np.linalg.qr(np.random.normal(size=shape))
+        return q
 
     def random_tangent_vector(self, point):
         tangent_vector = np.random.normal(size=point.shape)
@@ -115,29 +232,26 @@ class Grassmann(_GrassmannBase):
         return tangent_vector / np.linalg.norm(tangent_vector)
 
     def exp(self, point, tangent_vector):
-        u, s, vt = svd(tangent_vector, full_matrices=False)
+        u, s, vt = _thin_svd(tangent_vector)
         cos_s = np.expand_dims(np.cos(s), -2)
         sin_s = np.expand_dims(np.sin(s), -2)
 
-        Y = multiprod(
-            multiprod(point, multitransp(vt) * cos_s), vt
-        ) + multiprod(u * sin_s, vt)
+        # Factor out the common right factor vt to save one matrix product.
+        Y = multiprod(point, multitransp(vt) * cos_s)
+        Y += u * sin_s
+        Y = multiprod(Y, vt)
 
         # From numerical experiments, it seems necessary to re-orthonormalize.
         # This is quite expensive.
-        if self._k == 1:
-            Y, _ = np.linalg.qr(Y)
-            return Y
-
-        for i in range(self._k):
-            Y[i], _ = np.linalg.qr(Y[i])
+        Y, _ = np.linalg.qr(Y)
         return Y
 
     def log(self, point_a, point_b):
-        ytx = multiprod(multitransp(point_b), point_a)
-        At = multitransp(point_b) - multiprod(ytx, multitransp(point_a))
+        yt = multitransp(point_b)
+        ytx = multiprod(yt, point_a)
+        At = yt - multiprod(ytx, multitransp(point_a))
         Bt = np.linalg.solve(ytx, At)
-        u, s, vt = svd(multitransp(Bt), full_matrices=False)
+        u, s, vt = _thin_svd(multitransp(Bt), overwrite=True)
         arctan_s = np.expand_dims(np.arctan(s), -2)
         return multiprod(u * arctan_s, vt)
 
@@ -156,15 +270,21 @@ class ComplexGrassmann(_GrassmannBase):
         n: Dimension of the ambient space.
         p: Dimension of the subspaces.
         k: The number of elements in the product.
+        retraction: The type of retraction to use.
+            Possible choices are ``polar`` and ``qr``.
 
     Note:
         Similar to :class:`Grassmann`, the complex Grassmannian is treated
         as a Riemannian quotient manifold of the complex Stiefel manifold
         with the unitary group :math:`\U(p) = \set{\vmU \in \R^{p \times p}
         : \transp{\vmU}\vmU = \vmU\transp{\vmU} = \Id_p}`.
+        As for :class:`Grassmann`, the default retraction is the polar
+        retraction and a QR-based retraction is available as an alternative.
     """
 
-    def __init__(self, n: int, p: int, *, k: int = 1):
+    def __init__(
+        self, n: int, p: int, *, k: int = 1, retraction: str = "polar"
+    ):
         self._n = n
         self._p = p
         self._k = k
@@ -183,13 +303,7 @@ class ComplexGrassmann(_GrassmannBase):
         dimension = int(2 * k * (n * p - p**2))
         super().__init__(name, dimension)
 
-    def dist(self, point_a, point_b):
-        s = np.linalg.svd(
-            multiprod(multihconj(point_a), point_b), compute_uv=False
-        )
-        s[s > 1] = 1
-        s = np.arccos(s)
-        return np.linalg.norm(np.real(s))
+        self._set_retraction(retraction)
 
     def inner_product(self, point, tangent_vector_a, tangent_vector_b):
         return np.real(
@@ -201,74 +315,54 @@ class ComplexGrassmann(_GrassmannBase):
         )
 
     def projection(self, point, vector):
-        return vector - multiprod(point, multiprod(multihconj(point), vector))
+        # Write the result into the buffer of the product to save allocating
+        # another array of the size of the vector.
+        projected = multiprod(point, multiprod(multihconj(point), vector))
+        return np.subtract(vector, projected, out=projected)
 
     def euclidean_to_riemannian_hessian(
         self, point, euclidean_gradient, euclidean_hessian, tangent_vector
     ):
-        PXehess = self.projection(point, euclidean_hessian)
-        XHG = multiprod(multihconj(point), euclidean_gradient)
-        HXHG = multiprod(tangent_vector, XHG)
-        return PXehess - HXHG
-
-    def retraction(self, point, tangent_vector):
-        # We do not need to worry about flipping signs of columns here,
-        # since only the column space is important, not the actual
-        # columns. Compare this with the Stiefel manifold.
-
-        # Compute the polar factorization of Y = X+G
-        u, _, vh = np.linalg.svd(point + tangent_vector, full_matrices=False)
-        return multiprod(u, vh)
+        # Conjugate transposition copies the point, so compute it only once.
+        XH = multihconj(point)
+        PXehess = multiprod(point, multiprod(XH, euclidean_hessian))
+        np.subtract(euclidean_hessian, PXehess, out=PXehess)
+        XHG = multiprod(XH, euclidean_gradient)
+        PXehess -= multiprod(tangent_vector, XHG)
+        return PXehess
 
     def random_point(self):
         if self._k == 1:
-            point, _ = np.linalg.qr(
-                (
-                    np.random.normal(size=(self._n, self._p))
-                    + 1j * np.random.normal(size=(self._n, self._p))
-                )
-            )
-            return point
-
-        point = np.zeros((self._k, self._n, self._p), np.complex_)
-        for i in range(self._k):
-            point[i], _ = np.linalg.qr(
-                (
-                    np.random.normal(size=(self._n, self._p))
-                    + 1j * np.random.normal(size=(self._n, self._p))
-                )
-            )
+            shape = (self._n, self._p)
+        else:
+            shape = (self._k, self._n, self._p)
+        point, _ = np.linalg.qr(_complex_normal(shape))
         return point
 
     def random_tangent_vector(self, point):
-        tangent_vector = np.random.normal(
-            size=point.shape
-        ) + 1j * np.random.normal(size=point.shape)
+        tangent_vector = _complex_normal(point.shape)
         tangent_vector = self.projection(point, tangent_vector)
         return tangent_vector / np.linalg.norm(tangent_vector)
 
     def exp(self, point, tangent_vector):
-        U, S, VH = np.linalg.svd(tangent_vector, full_matrices=False)
+        U, S, VH = _thin_svd(tangent_vector)
         cos_S = np.expand_dims(np.cos(S), -2)
         sin_S = np.expand_dims(np.sin(S), -2)
-        Y = multiprod(
-            multiprod(point, multihconj(VH) * cos_S), VH
-        ) + multiprod(U * sin_S, VH)
+        # Factor out the common right factor VH to save one matrix product.
+        Y = multiprod(point, multihconj(VH) * cos_S)
+        Y += U * sin_S
+        Y = multiprod(Y, VH)
 
         # From numerical experiments, it seems necessary to
         # re-orthonormalize. This is overall quite expensive.
-        if self._k == 1:
-            Y, _ = np.linalg.qr(Y)
-            return Y
-
-        for i in range(self._k):
-            Y[i], _ = np.linalg.qr(Y[i])
+        Y, _ = np.linalg.qr(Y)
         return Y
 
     def log(self, point_a, point_b):
-        YHX = multiprod(multihconj(point_b), point_a)
-        AH = multihconj(point_b) - multiprod(YHX, multihconj(point_a))
+        YH = multihconj(point_b)
+        YHX = multiprod(YH, point_a)
+        AH = YH - multiprod(YHX, multihconj(point_a))
         BH = np.linalg.solve(YHX, AH)
-        U, S, VH = np.linalg.svd(multihconj(BH), full_matrices=False)
+        U, S, VH = _thin_svd(multihconj(BH), overwrite=True)
         arctan_S = np.expand_dims(np.arctan(S), -2)
         return multiprod(U * arctan_S, VH)
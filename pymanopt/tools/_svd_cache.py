@@ -0,0 +1,74 @@
+import functools
+
+import numpy as np
+from scipy.linalg.lapack import get_lapack_funcs
+
+
+# The number of distinct dtypes, shapes and flags to keep workspace sizes for.
+# Typical optimization problems only decompose matrices of a few shapes.
+CACHE_SIZE = 64
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _get_gesdd(dtype, shape, compute_uv, full_matrices):
+    gesdd, gesdd_lwork = get_lapack_funcs(
+        ("gesdd", "gesdd_lwork"), dtype=dtype
+    )
+    work, info = gesdd_lwork(
+        *shape, compute_uv=compute_uv, full_matrices=full_matrices
+    )
+    if info != 0:
+        raise ValueError(
+            f"Illegal value in argument {-info} of internal gesdd_lwork"
+        )
+    # The workspace size is returned in the precision of the matrix which
+    # may round it down, so round up to the next representable number.
+    real_type = np.finfo(dtype).dtype.type
+    lwork = int(np.nextafter(real_type(np.real(work)), real_type(np.inf)))
+    return gesdd, lwork
+
+
+def cached_svd(A, *, full_matrices=False, compute_uv=True, overwrite_a=False):
+    """Singular value decomposition with cached LAPACK workspace queries.
+
+    Optimizers decompose matrices of the same shape in every iteration.
+    This function calls LAPACK's ``gesdd`` routine directly and memoizes the
+    routine lookup and the optimal workspace size per dtype and shape, which
+    make up a considerable part of the cost of :func:`scipy.linalg.svd` for
+    small matrices.
+    The input is not checked for non-finite values.
+
+    Args:
+        A: The matrix to decompose.
+        full_matrices: Whether to compute full or thin factors ``u`` and
+            ``vt``.
+        compute_uv: Whether to compute ``u`` and ``vt`` in addition to the
+            singular values.
+        overwrite_a: Whether the memory of ``A`` may be reused.
+
+    Returns:
+        The tuple ``(u, s, vt)`` if ``compute_uv`` is true, and the singular
+        values ``s`` otherwise.
+    """
+    A = np.asarray(A)
+    if A.ndim != 2:
+        raise ValueError("Expected a two-dimensional array")
+    gesdd, lwork = _get_gesdd(
+        A.dtype, A.shape, bool(compute_uv), bool(full_matrices)
+    )
+    u, s, vt, info = gesdd(
+        A,
+        compute_uv=compute_uv,
+        full_matrices=full_matrices,
+        lwork=lwork,
+        overwrite_a=overwrite_a,
+    )
+    if info > 0:
+        raise np.linalg.LinAlgError("SVD did not converge")
+    if info < 0:
+        raise ValueError(
+            f"Illegal value in argument {-info} of internal gesdd"
+        )
+    if compute_uv:
+        return u, s, vt
+    return s
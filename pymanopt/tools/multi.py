@@ -1,6 +1,8 @@
 import numpy as np
 import scipy.linalg
 
+from pymanopt.tools import _multi_numba
+
 
 def multiprod(A: np.ndarray, B: np.ndarray) -> np.ndarray:
     """Vectorized matrix-matrix multiplication.
@@ -21,9 +23,7 @@ def multiprod(A: np.ndarray, B: np.ndarray) -> np.ndarray:
         the matrix product vectorized over the first dimension of ``A`` and
         ``B`` (if ``A.ndim == 2``).
     """
-    if A.ndim == 2:
-        return A @ B
-    return np.einsum("ijk,ikl->ijl", A, B)
+    return A @ B
 
 
 def multitransp(A):
@@ -41,7 +41,12 @@ def multitransp(A):
 
 
 def multihconj(A):
-    """Vectorized matrix conjugate transpose."""
+    """Vectorized matrix conjugate transpose.
+
+    For real arrays, this returns a view of ``A`` like :func:`multitransp`.
+    """
+    if not np.iscomplexobj(A):
+        return multitransp(A)
     return np.conjugate(multitransp(A))
 
 
@@ -52,6 +57,10 @@ def multisym(A):
     n)``), returns a version of ``A`` with each matrix symmetrized, i.e.,
     every matrix ``A[i]`` satisfies ``A[i] == A[i].T``.
     """
+    # Check the cheap condition first to keep the overhead for single
+    # matrices minimal.
+    if A.ndim == 3 and _multi_numba.is_supported(A):
+        return _multi_numba.multisym(A)
     return 0.5 * (A + multitransp(A))
 
 
@@ -62,18 +71,33 @@ def multiskew(A):
     ``A[i]`` is skew-symmetric, i.e., the components of ``A`` satisfy ``A[i] ==
     -A[i].T``.
     """
+    if A.ndim == 3 and _multi_numba.is_supported(A):
+        return _multi_numba.multiskew(A)
     return 0.5 * (A - multitransp(A))
 
 
 def multieye(k, n):
-    """Array of ``k`` ``n x n`` identity matrices."""
-    return np.tile(np.eye(n), (k, 1, 1))
+    """Array of ``k`` ``n x n`` identity matrices.
+
+    The identity matrix is not replicated in memory, i.e., the returned array
+    is a read-only view into a single ``n x n`` identity matrix.
+    Call ``copy`` on the returned array to obtain a writable array.
+    """
+    return np.broadcast_to(np.eye(n), (k, n, n))
 
 
 def multilogm(A, *, positive_definite=False):
     """Vectorized matrix logarithm."""
     if not positive_definite:
-        return np.vectorize(scipy.linalg.logm, signature="(m,m)->(m,m)")(A)
+        if A.ndim == 2:
+            return scipy.linalg.logm(A)
+        # There is no vectorized implementation of the general matrix
+        # logarithm, so we fall back to decomposing the matrices one by one.
+        logmA = [
+            scipy.linalg.logm(matrix)
+            for matrix in np.reshape(A, (-1, *A.shape[-2:]))
+        ]
+        return np.reshape(logmA, A.shape)
 
     w, v = np.linalg.eigh(A)
     w = np.expand_dims(np.log(w), axis=-1)
@@ -86,7 +110,7 @@ def multilogm(A, *, positive_definite=False):
 def multiexpm(A, *, symmetric=False):
     """Vectorized matrix exponential."""
     if not symmetric:
-        return np.vectorize(scipy.linalg.expm, signature="(m,m)->(m,m)")(A)
+        return scipy.linalg.expm(A)
 
     w, v = np.linalg.eigh(A)
     w = np.expand_dims(np.exp(w), axis=-1)
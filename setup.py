@@ -7,12 +7,12 @@ from setuptools import find_packages, setup
 
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-OPTIONAL_DEPENDENCIES = ("autograd", "tensorflow")
+OPTIONAL_DEPENDENCIES = ("autograd", "numba", "tensorflow")
 
 
 def parse_requirements_file(filename):
     with open(filename) as f:
-        return [line.strip() for line in f.read().splitlines()]
+        return [line.strip() for line in f if line.strip()]
 
 
 if __name__ == "__main__":
@@ -33,7 +33,7 @@ if __name__ == "__main__":
 
     dev_requirements = parse_requirements_file("requirements/dev.txt")
     extras_require = {"test": dev_requirements, **optional_dependencies}
-    extras_require["all"] = list(chain(*extras_require.values()))
+    extras_require["all"] = sorted(set(chain(*extras_require.values())))
 
     pymanopt_version = runpy.run_path(
         os.path.join(BASE_DIR, "pymanopt", "_version.py")
@@ -60,8 +60,6 @@ if __name__ == "__main__":
             "Topic :: Scientific/Engineering :: Mathematics",
             "License :: OSI Approved :: BSD License",
             "Programming Language :: Python :: 3",
-            "Programming Language :: Python :: 3.6",
-            "Programming Language :: Python :: 3.7",
             "Programming Language :: Python :: 3.8",
             "Programming Language :: Python :: 3.9",
         ],
@@ -71,6 +69,7 @@ if __name__ == "__main__":
             "autograd,tensorflow"
         ),
         packages=find_packages(exclude=["tests"]),
+        python_requires=">=3.8",
         install_requires=install_requires,
         extras_require=extras_require,
         long_description=long_description,
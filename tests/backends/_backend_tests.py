@@ -1,3 +1,4 @@
+import functools
 import unittest
 
 import numpy as np
@@ -26,6 +27,37 @@ def manifold_factory(point_layout):
     return CustomManifold()
 
 
+@functools.lru_cache(maxsize=None)
+def _random_arrays(*shapes):
+    """Draw seeded random arrays of the given shapes.
+
+    The test cases below are run once per backend. Caching the draws means
+    all backends operate on the same data, which is only generated once per
+    process. The arrays are views into a single buffer which is filled with
+    one call to the generator.
+    """
+    sizes = [int(np.prod(shape)) for shape in shapes]
+    buffer = np.empty(sum(sizes))
+    np.random.default_rng(0).standard_normal(out=buffer)
+    chunks = np.split(buffer, np.cumsum(sizes)[:-1])
+    return tuple(chunk.reshape(shape) for chunk, shape in zip(chunks, shapes))
+
+
+def _reference_derivatives(y, a):
+    """Cost, gradient and Hessian-vector product of ``exp(sum(y ** 2))``.
+
+    The Hessian of the cost is::
+
+        H = exp(||y||^2) * (4 * y (x) y + 2 * Id),
+
+    where ``(x)`` denotes the outer product, so its application to ``a``
+    reduces to an inner product without forming ``H``.
+    This holds for arrays ``y`` and ``a`` of any (matching) shape.
+    """
+    cost = np.exp(np.sum(y**2))
+    return cost, 2 * y * cost, cost * (4 * y * np.sum(y * a) + 2 * a)
+
+
 class TestUnaryFunction(unittest.TestCase):
     """Test cost function, gradient and Hessian for a unary cost function.
 
@@ -175,32 +207,25 @@ class TestNaryParameterGrouping(unittest.TestCase):
 
 
 class TestVector(unittest.TestCase):
-    def setUp(self):
-        np.seterr(all="raise")
-
-        self.manifold = manifold_factory(point_layout=1)
+    @classmethod
+    def setUpClass(cls):
+        cls._error_settings = np.seterr(all="raise")
 
-        n = self.n = 15
+        cls.manifold = manifold_factory(point_layout=1)
 
-        Y = self.Y = np.random.normal(size=n)
-        A = self.A = np.random.normal(size=n)
+        n = cls.n = 15
 
-        # Calculate correct cost and grad...
-        self.correct_cost = np.exp(np.sum(Y**2))
-        self.correct_grad = 2 * Y * np.exp(np.sum(Y**2))
+        Y, A = cls.Y, cls.A = _random_arrays(n, n)
 
-        # ... and hess
-        # First form hessian matrix H
-        # Convert Y and A into matrices (row vectors)
-        Ymat = np.matrix(Y)
-        Amat = np.matrix(A)
+        (
+            cls.correct_cost,
+            cls.correct_grad,
+            cls.correct_hess,
+        ) = _reference_derivatives(Y, A)
 
-        diag = np.eye(n)
-
-        H = np.exp(np.sum(Y**2)) * (4 * Ymat.T @ Ymat + 2 * diag)
-
-        # Then 'left multiply' H by A
-        self.correct_hess = np.squeeze(np.array(Amat @ H))
+    @classmethod
+    def tearDownClass(cls):
+        np.seterr(**cls._error_settings)
 
     def test_compile(self):
         np_testing.assert_allclose(self.correct_cost, self.cost(self.Y))
@@ -217,36 +242,26 @@ class TestVector(unittest.TestCase):
 
 
 class TestMatrix(unittest.TestCase):
-    def setUp(self):
-        np.seterr(all="raise")
-
-        self.manifold = manifold_factory(point_layout=1)
-
-        m = self.m = 10
-        n = self.n = 15
+    @classmethod
+    def setUpClass(cls):
+        cls._error_settings = np.seterr(all="raise")
 
-        Y = self.Y = np.random.normal(size=(m, n))
-        A = self.A = np.random.normal(size=(m, n))
+        cls.manifold = manifold_factory(point_layout=1)
 
-        # Calculate correct cost and grad...
-        self.correct_cost = np.exp(np.sum(Y**2))
-        self.correct_grad = 2 * Y * np.exp(np.sum(Y**2))
+        m = cls.m = 10
+        n = cls.n = 15
 
-        # ... and hess
-        # First form hessian tensor H (4th order)
-        Y1 = Y.reshape(m, n, 1, 1)
-        Y2 = Y.reshape(1, 1, m, n)
+        Y, A = cls.Y, cls.A = _random_arrays((m, n), (m, n))
 
-        # Create an m x n x m x n array with diag[i,j,k,l] == 1 iff
-        # (i == k and j == l), this is a 'diagonal' tensor.
-        diag = np.eye(m * n).reshape(m, n, m, n)
+        (
+            cls.correct_cost,
+            cls.correct_grad,
+            cls.correct_hess,
+        ) = _reference_derivatives(Y, A)
 
-        H = np.exp(np.sum(Y**2)) * (4 * Y1 * Y2 + 2 * diag)
-
-        # Then 'right multiply' H by A
-        Atensor = A.reshape(1, 1, m, n)
-
-        self.correct_hess = np.sum(H * Atensor, axis=(2, 3))
+    @classmethod
+    def tearDownClass(cls):
+        np.seterr(**cls._error_settings)
 
     def test_compile(self):
         np_testing.assert_allclose(self.correct_cost, self.cost(self.Y))
@@ -263,36 +278,27 @@ class TestMatrix(unittest.TestCase):
 
 
 class TestTensor3(unittest.TestCase):
-    def setUp(self):
-        np.seterr(all="raise")
-
-        self.manifold = manifold_factory(point_layout=1)
-
-        n1 = self.n1 = 3
-        n2 = self.n2 = 4
-        n3 = self.n3 = 5
+    @classmethod
+    def setUpClass(cls):
+        cls._error_settings = np.seterr(all="raise")
 
-        Y = self.Y = np.random.normal(size=(n1, n2, n3))
-        A = self.A = np.random.normal(size=(n1, n2, n3))
+        cls.manifold = manifold_factory(point_layout=1)
 
-        # Calculate correct cost and grad...
-        self.correct_cost = np.exp(np.sum(Y**2))
-        self.correct_grad = 2 * Y * np.exp(np.sum(Y**2))
+        n1 = cls.n1 = 3
+        n2 = cls.n2 = 4
+        n3 = cls.n3 = 5
 
-        # ... and hess
-        # First form hessian tensor H (6th order)
-        Y1 = Y.reshape(n1, n2, n3, 1, 1, 1)
-        Y2 = Y.reshape(1, 1, 1, n1, n2, n3)
+        Y, A = cls.Y, cls.A = _random_arrays((n1, n2, n3), (n1, n2, n3))
 
-        # Create an n1 x n2 x n3 x n1 x n2 x n3 diagonal tensor
-        diag = np.eye(n1 * n2 * n3).reshape(n1, n2, n3, n1, n2, n3)
+        (
+            cls.correct_cost,
+            cls.correct_grad,
+            cls.correct_hess,
+        ) = _reference_derivatives(Y, A)
 
-        H = np.exp(np.sum(Y**2)) * (4 * Y1 * Y2 + 2 * diag)
-
-        # Then 'right multiply' H by A
-        Atensor = A.reshape(1, 1, 1, n1, n2, n3)
-
-        self.correct_hess = np.sum(H * Atensor, axis=(3, 4, 5))
+    @classmethod
+    def tearDownClass(cls):
+        np.seterr(**cls._error_settings)
 
     def test_compile(self):
         np_testing.assert_allclose(self.correct_cost, self.cost(self.Y))
@@ -309,86 +315,32 @@ class TestTensor3(unittest.TestCase):
 
 
 class TestMixed(unittest.TestCase):
-    def setUp(self):
-        np.seterr(all="raise")
-
-        self.manifold = manifold_factory(point_layout=3)
-
-        n1 = self.n1 = 3
-        n2 = self.n2 = 4
-        n3 = self.n3 = 5
-        n4 = self.n4 = 6
-        n5 = self.n5 = 7
-        n6 = self.n6 = 8
-
-        self.y = y = (
-            np.random.normal(size=n1),
-            np.random.normal(size=(n2, n3)),
-            np.random.normal(size=(n4, n5, n6)),
-        )
-        self.a = a = (
-            np.random.normal(size=n1),
-            np.random.normal(size=(n2, n3)),
-            np.random.normal(size=(n4, n5, n6)),
-        )
-
-        self.correct_cost = (
-            np.exp(np.sum(y[0] ** 2))
-            + np.exp(np.sum(y[1] ** 2))
-            + np.exp(np.sum(y[2] ** 2))
-        )
-
-        # Calculate correct grad
-        g1 = 2 * y[0] * np.exp(np.sum(y[0] ** 2))
-        g2 = 2 * y[1] * np.exp(np.sum(y[1] ** 2))
-        g3 = 2 * y[2] * np.exp(np.sum(y[2] ** 2))
-
-        self.correct_grad = (g1, g2, g3)
-
-        # Calculate correct hess
-        # 1. Vector
-        Ymat = np.matrix(y[0])
-        Amat = np.matrix(a[0])
-
-        diag = np.eye(n1)
-
-        H = np.exp(np.sum(y[0] ** 2)) * (4 * Ymat.T @ Ymat + 2 * diag)
-
-        # Then 'left multiply' H by A
-        h1 = np.array(Amat @ H).flatten()
-
-        # 2. MATRIX
-        # First form hessian tensor H (4th order)
-        Y1 = y[1].reshape(n2, n3, 1, 1)
-        Y2 = y[1].reshape(1, 1, n2, n3)
-
-        # Create an m x n x m x n array with diag[i,j,k,l] == 1 iff
-        # (i == k and j == l), this is a 'diagonal' tensor.
-        diag = np.eye(n2 * n3).reshape(n2, n3, n2, n3)
-
-        H = np.exp(np.sum(y[1] ** 2)) * (4 * Y1 * Y2 + 2 * diag)
-
-        # Then 'right multiply' H by A
-        Atensor = a[1].reshape(1, 1, n2, n3)
-
-        h2 = np.sum(H * Atensor, axis=(2, 3))
-
-        # 3. Tensor3
-        # First form hessian tensor H (6th order)
-        Y1 = y[2].reshape(n4, n5, n6, 1, 1, 1)
-        Y2 = y[2].reshape(1, 1, 1, n4, n5, n6)
-
-        # Create an n1 x n2 x n3 x n1 x n2 x n3 diagonal tensor
-        diag = np.eye(n4 * n5 * n6).reshape(n4, n5, n6, n4, n5, n6)
-
-        H = np.exp(np.sum(y[2] ** 2)) * (4 * Y1 * Y2 + 2 * diag)
-
-        # Then 'right multiply' H by A
-        Atensor = a[2].reshape(1, 1, 1, n4, n5, n6)
-
-        h3 = np.sum(H * Atensor, axis=(3, 4, 5))
-
-        self.correct_hess = (h1, h2, h3)
+    @classmethod
+    def setUpClass(cls):
+        cls._error_settings = np.seterr(all="raise")
+
+        cls.manifold = manifold_factory(point_layout=3)
+
+        n1 = cls.n1 = 3
+        n2 = cls.n2 = 4
+        n3 = cls.n3 = 5
+        n4 = cls.n4 = 6
+        n5 = cls.n5 = 7
+        n6 = cls.n6 = 8
+
+        shapes = (n1, (n2, n3), (n4, n5, n6))
+        arrays = _random_arrays(*shapes, *shapes)
+        cls.y = y = arrays[:3]
+        cls.a = a = arrays[3:]
+
+        costs, grads, hesses = zip(*map(_reference_derivatives, y, a))
+        cls.correct_cost = sum(costs)
+        cls.correct_grad = grads
+        cls.correct_hess = hesses
+
+    @classmethod
+    def tearDownClass(cls):
+        np.seterr(**cls._error_settings)
 
     def test_compile(self):
         np_testing.assert_allclose(self.correct_cost, self.cost(*self.y))
@@ -1,4 +1,5 @@
 import autograd.numpy as np
+from nose2.tools import params
 from numpy import testing as np_testing
 
 from pymanopt.manifolds import ComplexGrassmann
@@ -86,6 +87,24 @@ class TestSingleComplexGrassmannManifold(TestCase):
             self.manifold.dist(X, Y),
         )
 
+    def test_dist_nearby_points(self):
+        X = self.manifold.random_point()
+        u = 1e-6 * self.manifold.random_tangent_vector(X)
+        np_testing.assert_allclose(
+            self.manifold.dist(X, self.manifold.exp(X, u)),
+            self.manifold.norm(X, u),
+        )
+
+    def test_dist_nearly_orthogonal_points(self):
+        X = self.manifold.random_point()
+        # Orthonormal directions in the orthogonal complement of span(X).
+        W, _ = np.linalg.qr(self.manifold.random_tangent_vector(X))
+        angles = np.pi / 2 - np.array([1e-7, 1e-4])
+        Y = X * np.cos(angles) + W * np.sin(angles)
+        np_testing.assert_allclose(
+            self.manifold.dist(X, Y), np.linalg.norm(angles), rtol=1e-14
+        )
+
     def test_exp_log_inverse(self):
         X = self.manifold.random_point()
         Y = self.manifold.random_point()
@@ -102,20 +121,24 @@ class TestSingleComplexGrassmannManifold(TestCase):
         # v is 0
         np_testing.assert_almost_equal(0, self.manifold.norm(X, U - V))
 
-    def test_retraction(self):
+    @params("polar", "qr")
+    def test_retraction(self, retraction):
         # Test that the result is on the manifold and that for small
         # tangent vectors it has little effect.
-        x = self.manifold.random_point()
-        u = self.manifold.random_tangent_vector(x)
+        manifold = ComplexGrassmann(
+            self.m, self.n, k=self.k, retraction=retraction
+        )
+        x = manifold.random_point()
+        u = manifold.random_tangent_vector(x)
 
-        xretru = self.manifold.retraction(x, u)
+        xretru = manifold.retraction(x, u)
 
         np_testing.assert_allclose(
             multiprod(multihconj(xretru), xretru), np.eye(self.n), atol=1e-10
         )
 
         u = u * 1e-6
-        xretru = self.manifold.retraction(x, u)
+        xretru = manifold.retraction(x, u)
         np_testing.assert_allclose(xretru, x + u)
 
 
@@ -221,13 +244,17 @@ class TestMultiComplexGrassmannManifold(TestCase):
         # v is 0
         np_testing.assert_almost_equal(0, self.manifold.norm(X, U - V))
 
-    def test_retraction(self):
+    @params("polar", "qr")
+    def test_retraction(self, retraction):
         # Test that the result is on the manifold and that for small
         # tangent vectors it has little effect.
-        x = self.manifold.random_point()
-        u = self.manifold.random_tangent_vector(x)
+        manifold = ComplexGrassmann(
+            self.m, self.n, k=self.k, retraction=retraction
+        )
+        x = manifold.random_point()
+        u = manifold.random_tangent_vector(x)
 
-        xretru = self.manifold.retraction(x, u)
+        xretru = manifold.retraction(x, u)
 
         np_testing.assert_allclose(
             multiprod(multihconj(xretru), xretru),
@@ -236,5 +263,5 @@ class TestMultiComplexGrassmannManifold(TestCase):
         )
 
         u = u * 1e-6
-        xretru = self.manifold.retraction(x, u)
+        xretru = manifold.retraction(x, u)
         np_testing.assert_allclose(xretru, x + u)
@@ -1,4 +1,5 @@
 import autograd.numpy as np
+from nose2.tools import params
 from numpy import testing as np_testing
 
 from pymanopt.manifolds import Grassmann
@@ -25,6 +26,24 @@ class TestSingleGrassmannManifold(TestCase):
             self.manifold.norm(x, self.manifold.log(x, y)),
         )
 
+    def test_dist_nearby_points(self):
+        x = self.manifold.random_point()
+        u = 1e-6 * self.manifold.random_tangent_vector(x)
+        np_testing.assert_allclose(
+            self.manifold.dist(x, self.manifold.exp(x, u)),
+            self.manifold.norm(x, u),
+        )
+
+    def test_dist_nearly_orthogonal_points(self):
+        x = self.manifold.random_point()
+        # Orthonormal directions in the orthogonal complement of span(x).
+        w, _ = np.linalg.qr(self.manifold.random_tangent_vector(x))
+        angles = np.pi / 2 - np.array([1e-7, 1e-4])
+        y = x * np.cos(angles) + w * np.sin(angles)
+        np_testing.assert_allclose(
+            self.manifold.dist(x, y), np.linalg.norm(angles), rtol=1e-14
+        )
+
     def test_euclidean_to_riemannian_hessian(self):
         # Test this function at some randomly generated point.
         x = self.manifold.random_point()
@@ -39,22 +58,40 @@ class TestSingleGrassmannManifold(TestCase):
             self.manifold.euclidean_to_riemannian_hessian(x, egrad, ehess, u),
         )
 
-    def test_retraction(self):
+    @params("polar", "qr")
+    def test_retraction(self, retraction):
         # Test that the result is on the manifold and that for small
         # tangent vectors it has little effect.
-        x = self.manifold.random_point()
-        u = self.manifold.random_tangent_vector(x)
+        manifold = Grassmann(self.m, self.n, k=self.k, retraction=retraction)
+        x = manifold.random_point()
+        u = manifold.random_tangent_vector(x)
 
-        xretru = self.manifold.retraction(x, u)
+        xretru = manifold.retraction(x, u)
 
         np_testing.assert_allclose(
             multiprod(multitransp(xretru), xretru), np.eye(self.n), atol=1e-10
         )
 
         u = u * 1e-6
-        xretru = self.manifold.retraction(x, u)
+        xretru = manifold.retraction(x, u)
         np_testing.assert_allclose(xretru, x + u)
 
+    def test_retractions_agree(self):
+        # Both retractions map to the same subspace.
+        x = self.manifold.random_point()
+        u = self.manifold.random_tangent_vector(x)
+        manifold_qr = Grassmann(self.m, self.n, k=self.k, retraction="qr")
+        np_testing.assert_almost_equal(
+            self.manifold.dist(
+                self.manifold.retraction(x, u), manifold_qr.retraction(x, u)
+            ),
+            0,
+        )
+
+    def test_invalid_retraction(self):
+        with self.assertRaises(ValueError):
+            Grassmann(self.m, self.n, retraction="cayley")
+
     # def test_euclidean_to_riemannian_gradient(self):
 
     # def test_norm(self):
@@ -143,13 +180,15 @@ class TestMultiGrassmannManifold(TestCase):
         Hproj = H - multiprod(X, multiprod(multitransp(X), H))
         np_testing.assert_allclose(Hproj, self.manifold.projection(X, H))
 
-    def test_retraction(self):
+    @params("polar", "qr")
+    def test_retraction(self, retraction):
         # Test that the result is on the manifold and that for small
         # tangent vectors it has little effect.
-        x = self.manifold.random_point()
-        u = self.manifold.random_tangent_vector(x)
+        manifold = Grassmann(self.m, self.n, k=self.k, retraction=retraction)
+        x = manifold.random_point()
+        u = manifold.random_tangent_vector(x)
 
-        xretru = self.manifold.retraction(x, u)
+        xretru = manifold.retraction(x, u)
 
         np_testing.assert_allclose(
             multiprod(multitransp(xretru), xretru),
@@ -158,7 +197,7 @@ class TestMultiGrassmannManifold(TestCase):
         )
 
         u = u * 1e-6
-        xretru = self.manifold.retraction(x, u)
+        xretru = manifold.retraction(x, u)
         np_testing.assert_allclose(xretru, x + u)
 
     # def test_euclidean_to_riemannian_gradient(self):
@@ -8,6 +8,7 @@ from pymanopt.tools.multi import (
     multihconj,
     multilogm,
     multiprod,
+    multiskew,
     multisym,
     multitransp,
 )
@@ -35,10 +36,9 @@ class TestMulti(TestCase):
         A = np.random.normal(size=(self.k, self.m, self.n))
         B = np.random.normal(size=(self.k, self.n, self.p))
 
-        C = np.zeros((self.k, self.m, self.p))
-        for i in range(self.k):
-            C[i] = A[i] @ B[i]
-
+        # Compare against einsum rather than matmul, which is what multiprod
+        # itself uses.
+        C = np.einsum("ijk,ikl->ijl", A, B)
         np_testing.assert_allclose(C, multiprod(A, B))
 
     def test_multitransp_singlemat(self):
@@ -48,25 +48,44 @@ class TestMulti(TestCase):
     def test_multitransp(self):
         A = np.random.normal(size=(self.k, self.m, self.n))
 
-        C = np.zeros((self.k, self.n, self.m))
-        for i in range(self.k):
-            C[i] = A[i].T
-
+        C = np.swapaxes(A, -1, -2)
         np_testing.assert_array_equal(C, multitransp(A))
 
     def test_multisym(self):
         A = np.random.normal(size=(self.k, self.m, self.m))
 
-        C = np.zeros((self.k, self.m, self.m))
-        for i in range(self.k):
-            C[i] = 0.5 * (A[i] + A[i].T)
-
+        C = 0.5 * (A + np.swapaxes(A, -1, -2))
         np.testing.assert_allclose(C, multisym(A))
 
+    def test_multisym_large_stack(self):
+        # Large stacks are symmetrized by a compiled kernel if numba is
+        # available.
+        A = np.random.normal(size=(1000, 10, 10))
+        np_testing.assert_allclose(
+            0.5 * (A + np.swapaxes(A, 1, 2)), multisym(A)
+        )
+
+    def test_multiskew_large_stack(self):
+        shape = (1000, 10, 10)
+        A = np.random.normal(size=shape) + 1j * np.random.normal(size=shape)
+        np_testing.assert_allclose(
+            0.5 * (A - np.swapaxes(A, 1, 2)), multiskew(A)
+        )
+
+    def test_multisym_large_stack_nonfinite(self):
+        # The compiled kernel propagates non-finite values like NumPy does.
+        A = np.random.normal(size=(1000, 10, 10))
+        A[0, 1, 2] = np.nan
+        A[1, 3, 3] = np.inf
+        A[2, 0, 4] = -np.inf
+        np_testing.assert_array_equal(
+            0.5 * (A + np.swapaxes(A, 1, 2)), multisym(A)
+        )
+
     def test_multieye(self):
         A = np.zeros((self.k, self.n, self.n))
-        for i in range(self.k):
-            A[i] = np.eye(self.n)
+        diagonal = np.arange(self.n)
+        A[:, diagonal, diagonal] = 1
 
         np_testing.assert_allclose(A, multieye(self.k, self.n))
 
@@ -80,13 +99,13 @@ class TestMulti(TestCase):
         )
 
     def test_multilogm(self):
-        A = np.zeros((self.k, self.m, self.m))
-        L = np.zeros((self.k, self.m, self.m))
-        for i in range(self.k):
-            a = np.diag(np.random.uniform(size=self.m))
-            q, _ = np.linalg.qr(np.random.normal(size=(self.m, self.m)))
-            A[i] = q @ a @ q.T
-            L[i] = logm(A[i])
+        # Build positive definite matrices A from known eigendecompositions
+        # so that the reference logarithms follow in closed form.
+        w = np.random.uniform(size=(self.k, self.m))
+        q, _ = np.linalg.qr(np.random.normal(size=(self.k, self.m, self.m)))
+        qt = multitransp(q)
+        A = (q * w[:, np.newaxis, :]) @ qt
+        L = (q * np.log(w)[:, np.newaxis, :]) @ qt
         np_testing.assert_allclose(multilogm(A, positive_definite=True), L)
 
     def test_multilogm_complex_positive_definite(self):
@@ -100,6 +119,29 @@ class TestMulti(TestCase):
             multilogm(A, positive_definite=False),
         )
 
+    def test_multilogm_general_singlemat(self):
+        # Matrices close to the identity have real logarithms.
+        A = np.eye(self.m) + 0.1 * np.random.normal(size=(self.m, self.m))
+        np_testing.assert_allclose(multilogm(A), logm(A))
+
+    def test_multilogm_general(self):
+        A = np.eye(self.m) + 0.1 * np.random.normal(
+            size=(self.k, self.m, self.m)
+        )
+        L = multilogm(A)
+        self.assertEqual(L.shape, A.shape)
+        for i in range(self.k):
+            np_testing.assert_allclose(L[i], logm(A[i]))
+
+    def test_multilogm_general_mixed_dtypes(self):
+        # Only the logarithm of the second matrix is complex, so the result
+        # must be promoted to a complex array.
+        A = np.array([np.diag([1.0, 2.0]), np.diag([-1.0, 2.0])])
+        L = multilogm(A)
+        self.assertEqual(L.dtype, np.complex128)
+        for i in range(len(A)):
+            np_testing.assert_allclose(L[i], logm(A[i]))
+
     def test_multiexpm_singlemat(self):
         # A is a positive definite matrix
         A = np.random.normal(size=(self.m, self.m))
@@ -107,10 +149,12 @@ class TestMulti(TestCase):
         np_testing.assert_allclose(multiexpm(A, symmetric=True), expm(A))
 
     def test_multiexpm(self):
-        A = multisym(np.random.normal(size=(self.k, self.m, self.m)))
-        e = np.zeros((self.k, self.m, self.m))
-        for i in range(self.k):
-            e[i] = expm(A[i])
+        # See test_multilogm.
+        w = np.random.uniform(size=(self.k, self.m))
+        q, _ = np.linalg.qr(np.random.normal(size=(self.k, self.m, self.m)))
+        qt = multitransp(q)
+        A = (q * w[:, np.newaxis, :]) @ qt
+        e = (q * np.exp(w)[:, np.newaxis, :]) @ qt
         np_testing.assert_allclose(multiexpm(A, symmetric=True), e)
 
     def test_multiexpm_conjugate_symmetric(self):
@@ -122,3 +166,14 @@ class TestMulti(TestCase):
         np_testing.assert_allclose(
             multiexpm(A, symmetric=True), multiexpm(A, symmetric=False)
         )
+
+    def test_multiexpm_general_singlemat(self):
+        A = np.random.normal(size=(self.m, self.m))
+        np_testing.assert_allclose(multiexpm(A), expm(A))
+
+    def test_multiexpm_general(self):
+        A = np.random.normal(size=(self.k, self.m, self.m))
+        e = multiexpm(A)
+        self.assertEqual(e.shape, A.shape)
+        for i in range(self.k):
+            np_testing.assert_allclose(e[i], expm(A[i]))
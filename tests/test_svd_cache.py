@@ -0,0 +1,43 @@
+import numpy as np
+from numpy import testing as np_testing
+
+from pymanopt.tools._svd_cache import cached_svd
+
+from ._test import TestCase
+
+
+class TestCachedSVD(TestCase):
+    def setUp(self):
+        self.m = 40
+        self.n = 5
+
+    def test_cached_svd(self):
+        A = np.random.normal(size=(self.m, self.n))
+        u, s, vt = cached_svd(A)
+        self.assertEqual(u.shape, (self.m, self.n))
+        self.assertEqual(vt.shape, (self.n, self.n))
+        np_testing.assert_allclose(s, np.linalg.svd(A, compute_uv=False))
+        np_testing.assert_allclose(u * s @ vt, A)
+
+    def test_cached_svd_full_matrices(self):
+        A = np.random.normal(size=(self.m, self.n))
+        u, s, vt = cached_svd(A, full_matrices=True)
+        self.assertEqual(u.shape, (self.m, self.m))
+        np_testing.assert_allclose(u[:, : self.n] * s @ vt, A)
+
+    def test_cached_svd_complex(self):
+        shape = (self.m, self.n)
+        A = np.random.normal(size=shape) + 1j * np.random.normal(size=shape)
+        u, s, vt = cached_svd(A)
+        np_testing.assert_allclose(u * s @ vt, A)
+
+    def test_cached_svd_singular_values(self):
+        A = np.random.normal(size=(self.m, self.n))
+        np_testing.assert_allclose(
+            cached_svd(A, compute_uv=False),
+            np.linalg.svd(A, compute_uv=False),
+        )
+
+    def test_cached_svd_stacked(self):
+        with self.assertRaises(ValueError):
+            cached_svd(np.random.normal(size=(2, self.m, self.n)))